@@ -84,7 +84,8 @@ def root():
 
 
 @app.get("/activities")
-def get_activities():
+def get_activities() -> dict[str, dict]:
+    """List all activities"""
     return activities
 
 